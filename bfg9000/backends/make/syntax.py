@@ -1,7 +1,6 @@
 import re
 from collections import namedtuple
 from enum import Enum
-from io import StringIO
 
 from ... import path
 from ... import safe_str
@@ -22,6 +21,15 @@ Include = namedtuple('Include', ['name', 'optional'])
 Syntax = Enum('Syntax', ['target', 'dependency', 'function', 'shell', 'clean'])
 Section = Enum('Section', ['path', 'command', 'flags', 'other'])
 
+# Syntaxes whose strings are passed along to the shell.
+_shell_syntaxes = frozenset([Syntax.function, Syntax.shell])
+
+# Commonly-used literals, shared to avoid re-creating them for every rule.
+_comma = safe_str.literal(',')
+_space = safe_str.literal(' ')
+_pipe = safe_str.literal(' | ')
+_percent = safe_str.literal('%')
+
 _comment_tmpl = """
 # Do not edit this file! It was automatically generated by bfg9000.
 # Instead, you should edit the source file that created this:
@@ -29,6 +37,43 @@ _comment_tmpl = """
 """.strip()
 
 
+# For targets and deps, we want to backslash-escape glob characters,
+# whitespace, '#' (comments), and '%' (patterns), plus '~' if it's at the
+# *beginning* of a path. On non-Windows systems, also backslash-escape ':'
+# (which separates targets and deps). Note: '$' is also escaped, but done
+# separately, as it's escaped with a second '$'.
+_extra_escapes = '' if platform_info().family == 'windows' else ':'
+_escape_chars = r'?*\[\]\s#%' + _extra_escapes
+_target_ex = re.compile(r'(\\*)(^~|[' + _escape_chars + '])')
+_dep_ex = re.compile(r'(\\*)(^~|[|' + _escape_chars + '])')
+
+# Double any backslashes preceding the escaped character and then add one more
+# to escape it. Using a template (rather than a function) lets `re` do the
+# substitution without calling back into Python for each match.
+_escape_repl = r'\1\1\\\2'
+
+# Quick checks to see if a string needs escaping at all. Most strings don't, so
+# this lets us skip the more-expensive substitutions.
+_target_check_ex = re.compile(r'^~|[$' + _escape_chars + ']')
+_dep_check_ex = re.compile(r'^~|[$|' + _escape_chars + ']')
+
+
+def _escape_table(chars):
+    table = {ord(i): '\\' + i for i in chars}
+    table[ord('$')] = '$$'
+    return table
+
+
+# Translation tables equivalent to the regexes above for ASCII strings with no
+# backslashes (i.e. the vast majority of paths). These let us escape a string
+# in a single pass without the regex engine. (The leading '~' is handled
+# separately.)
+_ascii_spaces = ''.join(i for i in map(chr, range(128)) if i.isspace())
+_target_table = _escape_table('?*[]#%' + _ascii_spaces + _extra_escapes)
+_dep_table = _escape_table('?*[]#%|' + _ascii_spaces + _extra_escapes)
+_table_unsafe_ex = re.compile(r'[\\\x80-\U0010ffff]')
+
+
 class syntax_string(safe_str.safe_string):
     def __init__(self, data, syntax=None, quoted=False):
         self.data = data
@@ -45,35 +90,44 @@ class syntax_string(safe_str.safe_string):
                                              syntax, self.quoted)
 
 
-class Writer:
-    # For targets and deps, we want to backslash-escape glob characters,
-    # whitespace, '#' (comments), and '%' (patterns), plus '~' if it's at the
-    # *beginning* of a path. On non-Windows systems, also backslash-escape ':'
-    # (which separates targets and deps). Note: '$' is also escaped, but done
-    # separately, as it's escaped with a second '$'.
-    __extra_escapes = '' if platform_info().family == 'windows' else ':'
-    __escape_chars = r'?*\[\]\s#%' + __extra_escapes
-    __target_ex = re.compile(r'(\\*)(^~|[' + __escape_chars + '])')
-    __dep_ex = re.compile(r'(\\*)(^~|[|' + __escape_chars + '])')
+class _StringBuilder(list):
+    # A minimal stand-in for `StringIO` used when writing nested strings; this
+    # is cheaper to create and append to for the handful of writes we do.
+    write = list.append
+
+    def getvalue(self):
+        return ''.join(self)
+
 
+class Writer:
     def __init__(self, stream, path_vars):
         self.stream = stream
         self.path_vars = path_vars
 
-    @classmethod
-    def escape_str(cls, string, syntax):
-        def repl(match):
-            return match.group(1) * 2 + '\\' + match.group(2)
+    @staticmethod
+    def _escape_path(string, check_ex, ex, table):
+        if not check_ex.search(string):
+            return string
+        if _table_unsafe_ex.search(string):
+            return ex.sub(_escape_repl, string.replace('$', '$$'))
 
+        result = string.translate(table)
+        return '\\' + result if result[0] == '~' else result
+
+    @staticmethod
+    def escape_str(string, syntax):
         if '\n' in string:
             raise ValueError('illegal newline')
-        result = string.replace('$', '$$')
 
         if syntax == Syntax.target:
-            return cls.__target_ex.sub(repl, result)
+            return Writer._escape_path(string, _target_check_ex, _target_ex,
+                                       _target_table)
         elif syntax == Syntax.dependency:
-            return cls.__dep_ex.sub(repl, result)
-        elif syntax == Syntax.function:
+            return Writer._escape_path(string, _dep_check_ex, _dep_ex,
+                                       _dep_table)
+
+        result = string.replace('$', '$$')
+        if syntax == Syntax.function:
             return result.replace(',', '$,')
         elif syntax in [Syntax.shell, Syntax.clean]:
             return result
@@ -82,56 +136,101 @@ class Writer:
             "unknown syntax '{}'".format(syntax)
         )  # pragma: no cover
 
+    def subwriter(self):
+        return Writer(_StringBuilder(), self.path_vars)
+
     def quote(self, string):
         return pshell.quote(string)
 
     def write_literal(self, string):
         self.stream.write(string)
 
-    def write(self, thing, syntax, shell_quote=pshell.quote_info):
-        thing = safe_str.safe_str(thing)
-        shelly = syntax in [Syntax.function, Syntax.shell]
+    def _write_literal(self, thing, syntax, shell_quote):
+        self.write_literal(thing.string)
+        return True
+
+    def _write_shell_literal(self, thing, syntax, shell_quote):
+        self.write_literal(self.escape_str(thing.string, syntax))
+        return True
+
+    def _write_str(self, thing, syntax, shell_quote):
+        escaped = False
+        if shell_quote and syntax in _shell_syntaxes:
+            thing, escaped = shell_quote(thing)
+        self.write_literal(self.escape_str(thing, syntax))
+        return escaped
+
+    def _write_syntax_string(self, thing, syntax, shell_quote):
+        out = self.subwriter()
+        escaped = out.write(thing.data, thing.syntax or syntax,
+                            None if thing.quoted else shell_quote)
+        result = out.stream.getvalue()
+        if thing.quoted:
+            result = pshell.wrap_quotes(result)
+        self.write_literal(result)
+        return escaped
+
+    def _write_jbos(self, thing, syntax, shell_quote):
         escaped = False
+        for i in thing.bits:
+            escaped |= self.write(i, syntax, shell_quote)
+        return escaped
 
-        if isinstance(thing, safe_str.literal):
-            escaped = True
-            self.write_literal(thing.string)
-        elif isinstance(thing, safe_str.shell_literal):
-            escaped = True
-            self.write_literal(self.escape_str(thing.string, syntax))
-        elif isinstance(thing, str):
-            if shelly and shell_quote:
-                thing, escaped = shell_quote(thing)
-            self.write_literal(self.escape_str(thing, syntax))
-        elif isinstance(thing, syntax_string):
-            out = Writer(StringIO(), self.path_vars)
-            escaped = out.write(thing.data, thing.syntax or syntax,
-                                None if thing.quoted else shell_quote)
-            result = out.stream.getvalue()
-            if thing.quoted:
-                result = pshell.wrap_quotes(result)
-            self.write_literal(result)
-        elif isinstance(thing, safe_str.jbos):
-            for i in thing.bits:
-                escaped |= self.write(i, syntax, shell_quote)
-        elif isinstance(thing, path.BasePath):
-            out = Writer(StringIO(), self.path_vars)
-            thing = thing.realize(self.path_vars, shelly)
-            escaped = out.write(thing, syntax, pshell.inner_quote_info)
-
-            thing = out.stream.getvalue()
-            if shelly and escaped:
-                thing = pshell.wrap_quotes(thing)
-            self.write_literal(thing)
-        else:
-            raise TypeError(type(thing))
+    def _write_path(self, thing, syntax, shell_quote):
+        shelly = syntax in _shell_syntaxes
+        out = self.subwriter()
+        thing = thing.realize(self.path_vars, shelly)
+        escaped = out.write(thing, syntax, pshell.inner_quote_info)
 
+        thing = out.stream.getvalue()
+        if shelly and escaped:
+            thing = pshell.wrap_quotes(thing)
+        self.write_literal(thing)
         return escaped
 
-    def write_each(self, things, syntax, delim=safe_str.literal(' '),
+    # The handlers for each type we can write, in order of precedence. We also
+    # keep a dict of these keyed on the exact type so that the common cases
+    # can be dispatched without walking through a chain of `isinstance` calls.
+    __handlers = [
+        (safe_str.literal, _write_literal),
+        (safe_str.shell_literal, _write_shell_literal),
+        (str, _write_str),
+        (syntax_string, _write_syntax_string),
+        (safe_str.jbos, _write_jbos),
+        (path.BasePath, _write_path),
+    ]
+    __dispatch = dict(__handlers)
+
+    def write(self, thing, syntax, shell_quote=pshell.quote_info):
+        thing = safe_str.safe_str(thing)
+        try:
+            handler = self.__dispatch[type(thing)]
+        except KeyError:
+            for kind, handler in self.__handlers:
+                if isinstance(thing, kind):
+                    break
+            else:
+                raise TypeError(type(thing))
+        return handler(self, thing, syntax, shell_quote)
+
+    def write_each(self, things, syntax, delim=_space,
                    prefix=None, suffix=None, shell_quote=pshell.quote_info):
-        for i in iterutils.tween(things, delim, prefix, suffix):
+        # This is equivalent to writing each item of `iterutils.tween(...)`,
+        # but avoids the overhead of the generator, since this is called a lot.
+        things = iter(things)
+        try:
+            first = next(things)
+        except StopIteration:
+            return
+
+        if prefix is not None:
+            self.write(prefix, syntax, shell_quote)
+        self.write(first, syntax, shell_quote)
+        for i in things:
+            self.write(delim, syntax, shell_quote)
             self.write(i, syntax, shell_quote)
+        if suffix is not None:
+            self.write(suffix, syntax, shell_quote)
 
     def write_shell(self, thing, syntax=Syntax.shell):
         if isinstance(thing, Silent):
@@ -171,13 +270,25 @@ class NamedEntity(Entity):
 
 class Pattern(Entity):
     def __init__(self, path):
-        if len(re.findall(r'((?<=[^\\])|^)(\\\\)*%', path)) != 1:
+        if self._count_wildcards(path) != 1:
             raise ValueError('exactly one % required')
         self.path = path
 
+    @staticmethod
+    def _count_wildcards(path):
+        # Count the '%'s in `path`, skipping any that are backslash-escaped.
+        count = i = 0
+        while i < len(path):
+            if path[i] == '\\':
+                i += 1
+            elif path[i] == '%':
+                count += 1
+            i += 1
+        return count
+
     def use(self):
-        bits = re.split(r'%', self.path)
-        return safe_str.join(bits, safe_str.literal('%'))
+        bits = self.path.split('%')
+        return safe_str.join(bits, _percent)
 
     def __hash__(self):
         return hash(self.path)
@@ -190,10 +301,16 @@ class Pattern(Entity):
 
 
 class Variable(NamedEntity):
+    __invalid_ex = re.compile(r'[\s:#=]')
+
     def __init__(self, name, quoted=False):
-        super().__init__(re.sub(r'[\s:#=]', '_', name))
+        super().__init__(self._sanitize_name(name))
         self.quoted = quoted
 
+    @classmethod
+    def _sanitize_name(cls, name):
+        return cls.__invalid_ex.sub('_', name)
+
     def use(self):
         fmt = '${}' if len(self.name) == 1 else '$({})'
         if self.quoted:
@@ -216,16 +333,16 @@ class Function(NamedEntity):
         self.quoted = quoted
 
     def use(self):
-        lit = safe_str.literal
-
-        prefix = lit('$(' + self.name)
-        suffix = lit(')')
-        data = prefix + safe_str.jbos.from_iterable(
-            safe_str.safe_str(j)
-            for i in iterutils.tween(self.args, lit(','), lit(' '))
-            for j in iterutils.tween(iterutils.iterate(i), lit(' '))
-        ) + suffix
-        return syntax_string(data, Syntax.function, self.quoted)
+        bits = [safe_str.literal('$(' + self.name)]
+        for i, arg in enumerate(self.args):
+            bits.append(_comma if i else _space)
+            for j, value in enumerate(iterutils.iterate(arg)):
+                if j:
+                    bits.append(_space)
+                bits.append(safe_str.safe_str(value))
+        bits.append(safe_str.literal(')'))
+        return syntax_string(safe_str.jbos(*bits), Syntax.function,
+                             self.quoted)
 
     def __eq__(self, rhs):
         return super().__eq__(rhs) and self.args == rhs.args
@@ -262,6 +379,7 @@ class Makefile:
 
         self._rules = []
         self._targets = set()
+        self._target_strs = {}
         self._includes = []
 
     def variable(self, name, value, section=Section.other, exist_ok=False):
@@ -291,23 +409,38 @@ class Makefile:
         return self.variable(name, cmd.command, Section.command, exist_ok=True)
 
     def has_variable(self, name):
-        return var(name) in self._var_table
+        if isinstance(name, Variable):
+            return name.name in self._var_table
+        return Variable._sanitize_name(name) in self._var_table
 
     def _unique_var(self, name, exist_ok):
         name = var(name)
-        exists = self.has_variable(name)
+        exists = name.name in self._var_table
         if exists and not exist_ok:
             raise ValueError('variable {!r} already exists'.format(name))
-        self._var_table.add(name)
+        self._var_table.add(name.name)
         return name, exists
 
     def include(self, name, optional=False):
         self._includes.append(Include(name, optional))
 
     def _target_str(self, name):
-        out = self.writer(StringIO())
+        # The same targets are often looked up repeatedly, so cache the escaped
+        # strings for any names that are hashable.
+        try:
+            key = (type(name), name)
+            return self._target_strs[key]
+        except KeyError:
+            pass
+        except TypeError:
+            key = None
+
+        out = self.writer(_StringBuilder())
         out.write(name, Syntax.target)
-        return out.stream.getvalue()
+        result = out.stream.getvalue()
+        if key is not None:
+            self._target_strs[key] = result
+        return result
 
     def rule(self, target, deps=None, order_only=None, recipe=None,
              variables=None, phony=False):
@@ -360,8 +493,13 @@ class Makefile:
         out.write_literal('endef\n\n')
 
     def _write_rule(self, out, rule):
+        # We already escaped the target names when the rule was added, so reuse
+        # those strings instead of escaping them again.
+        targets = [safe_str.literal(self._target_str(i))
+                   for i in rule.targets]
+
         if rule.variables:
-            for target in rule.targets:
+            for target in targets:
                 for name, value in rule.variables.items():
                     self._write_variable(out, name, value, target=target)
 
@@ -370,12 +508,11 @@ class Makefile:
             out.write_each(rule.targets, Syntax.dependency)
             out.write_literal('\n')
 
-        out.write_each(rule.targets, Syntax.target)
+        out.write_each(targets, Syntax.target)
         out.write_literal(':')
 
-        lit = safe_str.literal
-        out.write_each(rule.deps, Syntax.dependency, prefix=lit(' '))
-        out.write_each(rule.order_only, Syntax.dependency, prefix=lit(' | '))
+        out.write_each(rule.deps, Syntax.dependency, prefix=_space)
+        out.write_each(rule.order_only, Syntax.dependency, prefix=_pipe)
 
         if isinstance(rule.recipe, Entity):
             out.write_literal(' ; ')
@@ -390,7 +527,9 @@ class Makefile:
         return Writer(out, self.path_vars)
 
     def write(self, out):
-        out = self.writer(out)
+        # Build up the entire makefile in memory and then write it to the
+        # stream all at once, rather than making many small writes.
+        stream, out = out, self.writer(_StringBuilder())
         out.write_literal(_comment_tmpl.format(self._bfgfile) + '\n\n')
 
         # Don't let make use built-in rules/variables.
@@ -426,3 +565,5 @@ class Makefile:
             out.write_literal(('-' if i.optional else '') + 'include ')
             out.write(i.name, Syntax.target)
             out.write_literal('\n')
+
+        stream.write(out.stream.getvalue())
@@ -6,6 +6,8 @@ from ..objutils import memoize
 
 @memoize
 def init():
-    # Import all the packages in this directory so their hooks get run.
-    for _, name, _ in pkgutil.walk_packages(__path__, '.'):
+    # Import all the modules and packages in this directory so their hooks get
+    # run. Subpackages import their own submodules, so there's no need to walk
+    # into them.
+    for _, name, _ in pkgutil.iter_modules(__path__, '.'):
         importlib.import_module(name, __package__)
@@ -149,8 +149,12 @@ class CompileSource(Compile):
             builder = context.env.builder(guessed_file.lang)
             if hasattr(builder, 'compiler'):
                 # This builder supports compilation; no need to forward to
-                # `generated_source`.
-                file = context['source_file'](file)
+                # `generated_source`. If guessing already gave us a source
+                # file, use it rather than resolving the path all over again.
+                if isinstance(guessed_file, SourceFile):
+                    file = guessed_file
+                else:
+                    file = context['source_file'](file)
             else:
                 # Pop off the `directory` argument and pass it to
                 # `generated_source`. This puts the intermediate source file in
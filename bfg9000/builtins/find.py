@@ -3,8 +3,9 @@ from enum import Enum
 from functools import reduce
 
 from . import builtin
-from ..glob import NameGlob, PathGlob
-from ..iterutils import iterate, listify
+from ..glob import Glob, NameGlob, PathGlob
+from ..iterutils import iterate, listify, uniques
+from ..objutils import memoize
 from ..backends.make import writer as make
 from ..backends.ninja import writer as ninja
 from ..backends.make.syntax import Writer, Syntax
@@ -13,6 +14,7 @@ from ..path import Path, Root, walk, uniquetrees
 from ..platforms import known_platforms
 
 build_input('find_dirs')(lambda build_inputs, env: set())
+build_input('find_listings')(lambda build_inputs, env: {})
 depfile_name = '.bfg_find_deps'
 
 
@@ -26,11 +28,13 @@ class FindResult(Enum):
     def __bool__(self):
         return self == self.include
 
+    # Just return whichever operand wins; constructing the result from its
+    # value is surprisingly slow, and this runs for every path we check.
     def __and__(self, rhs):
-        return type(self)(max(self.value, rhs.value))
+        return self if self.value >= rhs.value else rhs
 
     def __or__(self, rhs):
-        return type(self)(min(self.value, rhs.value))
+        return self if self.value <= rhs.value else rhs
 
 
 class FileFilter:
@@ -43,11 +47,33 @@ class FileFilter:
         self.exclude = [NameGlob(i, type) for i in iterate(exclude)]
         self.filter_fn = filter_fn
 
+        self._extra_ex = self._combine_name_globs(self.extra)
+        self._exclude_ex = self._combine_name_globs(self.exclude)
+
+    @staticmethod
+    def _combine_name_globs(globs):
+        # Every path we see gets checked against all the `extra` and `exclude`
+        # globs, so merge them into one regex for files and one for
+        # directories. Then we only need a single match per path. Note that
+        # on some Python versions, `fnmatch.translate` adds named groups, so
+        # we can't include the same (cached) pattern twice.
+        def combine(type):
+            patterns = uniques(i.pattern.pattern for i in globs
+                               if i.type & type)
+            return re.compile('|'.join(patterns)).match if patterns else None
+
+        return {False: combine(Glob.Type.file), True: combine(Glob.Type.dir)}
+
+    @staticmethod
+    def _match_names(matchers, path):
+        match = matchers[bool(path.directory)]
+        return match is not None and match(path.basename()) is not None
+
     def bases(self):
         return uniquetrees([i.base for i in self.include])
 
     def _match_globs(self, path):
-        if any(i.match(path) for i in self.exclude):
+        if self._match_names(self._exclude_ex, path):
             return FindResult.exclude_recursive
 
         skip_base = len(self.include) == 1
@@ -56,7 +82,7 @@ class FileFilter:
         if result:
             return FindResult.include
 
-        if any(i.match(path) for i in self.extra):
+        if self._match_names(self._extra_ex, path):
             return FindResult.not_now
 
         if result == PathGlob.Result.never:
@@ -77,16 +103,20 @@ def write_depfile(env, path, output, seen_dirs, makeify=False):
         roots = env.base_dirs.copy()
         roots[Root.builddir] = None
 
+        # Realize each directory's path once up front, since we may need to
+        # write them all out twice below.
+        seen_dirs = [i.string(roots) for i in seen_dirs]
+
         out = Writer(f, None)
         out.write(output.string(roots), Syntax.target)
         out.write_literal(':')
         for i in seen_dirs:
             out.write_literal(' ')
-            out.write(i.string(roots), Syntax.dependency)
+            out.write(i, Syntax.dependency)
         out.write_literal('\n')
         if makeify:
             for i in seen_dirs:
-                out.write(i.string(roots), Syntax.target)
+                out.write(i, Syntax.target)
                 out.write_literal(':\n')
 
 
@@ -94,24 +124,28 @@ def _path_type(path):
     return 'd' if path.directory else 'f'
 
 
+@memoize
+def _platform_filter_ex(genus, family):
+    my_plat = {genus, family}
+    sub = '|'.join(re.escape(i) for i in known_platforms if i not in my_plat)
+    return re.compile(r'(^|/|_)(' + sub + r')(\.[^\.]+$|$|/)')
+
+
 @builtin.function()
 def filter_by_platform(context, path):
-    env = context.env
-    my_plat = {env.target_platform.genus, env.target_platform.family}
-
-    sub = '|'.join(re.escape(i) for i in known_platforms if i not in my_plat)
-    ex = r'(^|/|_)(' + sub + r')(\.[^\.]+$|$|/)'
-    return (FindResult.not_now if re.search(ex, path.suffix)
+    platform = context.env.target_platform
+    ex = _platform_filter_ex(platform.genus, platform.family)
+    return (FindResult.not_now if ex.search(path.suffix)
             else FindResult.include)
 
 
-def _find_files(env, filter, seen_dirs=None):
+def _find_files(env, filter, seen_dirs=None, listings=None):
     paths = filter.bases()
 
     for p in paths:
         yield p, filter.match(p)
     for p in paths:
-        for base, dirs, files in walk(p, env.base_dirs):
+        for base, dirs, files in walk(p, env.base_dirs, cache=listings):
             if seen_dirs is not None:
                 seen_dirs.append(base)
             to_remove = []
@@ -151,8 +185,14 @@ def find_files(context, pattern, *, type=None, extra=None, exclude=None,
     exclude = context.build['project']['find_exclude'] + listify(exclude)
     file_filter = FileFilter(pattern, type, extra, exclude, filter)
 
+    # Projects often call `find_files` several times over the same tree
+    # (e.g. once for sources and once for headers), so share directory
+    # listings between calls unless we've been asked not to cache.
+    listings = context.build['find_listings'] if cache else None
+
     found, seen_dirs = [], []
-    for path, matched in _find_files(context.env, file_filter, seen_dirs):
+    for path, matched in _find_files(context.env, file_filter, seen_dirs,
+                                     listings):
         if matched == FindResult.include:
             found.append(types[_path_type(path)](path, dist=dist))
         elif matched == FindResult.not_now and dist:
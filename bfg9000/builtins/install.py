@@ -19,12 +19,23 @@ class InstallOutputs:
         self.target = OrderedDict()
         self.env = env
 
+        # Libraries are often installed as the dependencies of many other
+        # files, so remember what we've already added to avoid cloning them
+        # (and walking their dependencies) again. This is keyed on the file's
+        # identity, since equal files can differ in ways that affect
+        # installation (e.g. a Directory's list of files).
+        self._added = {}
+
     def add(self, item, directory=None):
         if item not in self.explicit:
             self.explicit.append(item)
         return self._add_implicit(item, directory)
 
     def _add_implicit(self, item, directory):
+        key = (id(item), directory)
+        if key in self._added:
+            return self._added[key][1]
+
         host = installify(item, directory=directory)
         target = installify(item, directory=directory, cross=self.env)
         assert len(item.all) == len(host.all) == len(target.all)
@@ -40,6 +51,8 @@ class InstallOutputs:
             for dep in src.install_deps:
                 self._add_implicit(dep, directory)
 
+        # Hold onto the item itself too, so its id can't be reused.
+        self._added[key] = (item, target)
         return target
 
     def __bool__(self):
@@ -9,13 +9,54 @@ from . import shell
 from .backends import list_backends
 from .file_types import Executable, Node
 from .iterutils import first, isiterable, listify
+from .objutils import hashify, memoize_method
 from .path import abspath, InstallRoot, Path, Root
-from .tools.common import Command
+from .tools.common import check_which, Command
 from .versioning import Version
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 LibraryMode = namedtuple('LibraryMode', ['shared', 'static'])
 
 
+# orjson is considerably faster than the standard library's json module when
+# reading and writing the environment file, so use it when it's available.
+# Either way, we read and write the file as UTF-8 bytes.
+if orjson:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:  # pragma: no cover
+    def _json_dumps(value):
+        return json.dumps(value).encode('utf-8')
+
+    _json_loads = json.loads
+
+
+# The environment file is pure data, so if msgpack is available, store it in
+# that format instead, since it's more compact and quicker to load. A JSON file
+# always starts with "{", which lets us tell the two formats apart.
+def _dump_state(state):
+    if msgpack:
+        return msgpack.packb(state, use_bin_type=True)
+    return _json_dumps(state)
+
+
+def _load_state(data):
+    if data[:1] == b'{':
+        return _json_loads(data)
+    if not msgpack:
+        raise EnvVersionError('msgpack is required to load this environment')
+    return msgpack.unpackb(data, raw=False)
+
+
 def try_to_json(value):
     return value.to_json() if value is not None else None
 
@@ -104,8 +145,20 @@ class EnvVarDict(dict):
             self[k] = v
 
     def getpaths(self, key, default=None, **kwargs):
-        return [abspath(i) for i in
-                shell.split_paths(self.get(key, default), **kwargs)]
+        value = self.get(key, default)
+        # Most path variables are unset, so don't bother looking up the
+        # working directory when there's nothing to parse.
+        if not value:
+            return []
+        return list(self._parse_paths(value, os.getcwd(), **kwargs))
+
+    # Path variables like `LIBRARY_PATH` are looked up repeatedly (e.g. by each
+    # linker's `search_dirs`), so only parse each value we see once. Since
+    # relative paths are resolved against the working directory, that's part
+    # of the key too.
+    @memoize_method
+    def _parse_paths(self, value, cwd, **kwargs):
+        return tuple(abspath(i) for i in shell.split_paths(value, **kwargs))
 
 
 class Toolchain:
@@ -125,7 +178,7 @@ class Toolchain:
 
 
 class Environment:
-    version = 17
+    version = 18
     envfile = '.bfg_environ'
 
     Mode = shell.Mode
@@ -135,6 +188,7 @@ class Environment:
         tools.init()
         env.__builders = {}
         env.__tools = {}
+        env.__which = {}
         return env
 
     def __init__(self, bfgdir, backend, backend_version, srcdir, builddir):
@@ -151,7 +205,7 @@ class Environment:
         self.toolchain = Toolchain()
         self.mopack = []
 
-        self.variables = EnvVarDict(dict(os.environ))
+        self.variables = EnvVarDict(os.environ)
 
     def finalize(self, install_dirs, library_mode, compdb, extra_args=None):
         # Fill in any install dirs that aren't already set (e.g. by a
@@ -197,15 +251,28 @@ class Environment:
     def getvar(self, key, default=None):
         return self.variables.get(key, default)
 
+    # These are called for every compiled and linked file, and after the first
+    # call the result is almost always cached, so look it up just once.
     def builder(self, lang):
-        if lang not in self.__builders:
-            self.__builders[lang] = tools.get_builder(self, lang)
-        return self.__builders[lang]
+        result = self.__builders.get(lang)
+        if result is None:
+            result = self.__builders[lang] = tools.get_builder(self, lang)
+        return result
 
     def tool(self, name):
-        if name not in self.__tools:
-            self.__tools[name] = tools.get_tool(self, name)
-        return self.__tools[name]
+        result = self.__tools.get(name)
+        if result is None:
+            result = self.__tools[name] = tools.get_tool(self, name)
+        return result
+
+    def check_which(self, names, kind='executable'):
+        # Builders for different languages often look up the same commands
+        # (e.g. `ar`), so only search the PATH for each set of names once.
+        key = (hashify(names), self.getvar('PATH'), self.getvar('PATHEXT'))
+        if key not in self.__which:
+            self.__which[key] = check_which(names, self.variables, kind=kind)
+        cmd, found = self.__which[key]
+        return list(cmd), found
 
     def _runner(self, lang):
         try:
@@ -255,38 +322,53 @@ class Environment:
         return self.execute(self.run_arguments(args, lang), *posargs, **kwargs)
 
     def save(self, path):
-        with open(os.path.join(path, self.envfile), 'w') as out:
-            json.dump({
-                'version': self.version,
-                'data': {
-                    'bfgdir': self.bfgdir.to_json(),
-                    'backend': self.backend,
-                    'backend_version': str(self.backend_version),
-
-                    'host_platform': self.host_platform.to_json(),
-                    'target_platform': self.target_platform.to_json(),
-
-                    'srcdir': self.srcdir.to_json(),
-                    'builddir': self.builddir.to_json(),
-                    'install_dirs': {
-                        k.name: try_to_json(v)
-                        for k, v in self.install_dirs.items()
-                    },
-                    'toolchain': self.toolchain.to_json(),
-                    'mopack': [i.to_json() for i in self.mopack],
-
-                    'library_mode': self.library_mode,
-                    'compdb': self.compdb,
-                    'extra_args': self.extra_args,
-
-                    'variables': self.variables.to_json(),
-                }
-            }, out)
+        state = _dump_state({
+            'version': self.version,
+            'data': {
+                'bfgdir': self.bfgdir.to_json(),
+                'backend': self.backend,
+                'backend_version': str(self.backend_version),
+
+                'host_platform': self.host_platform.to_json(),
+                'target_platform': self.target_platform.to_json(),
+
+                'srcdir': self.srcdir.to_json(),
+                'builddir': self.builddir.to_json(),
+                'install_dirs': {
+                    k.name: try_to_json(v)
+                    for k, v in self.install_dirs.items()
+                },
+                'toolchain': self.toolchain.to_json(),
+                'mopack': [i.to_json() for i in self.mopack],
+
+                'library_mode': list(self.library_mode),
+                'compdb': self.compdb,
+                'extra_args': self.extra_args,
+
+                'variables': self.variables.to_json(),
+            }
+        })
+
+        # Reconfiguring often produces exactly the same environment, so don't
+        # touch the file if nothing's changed. Otherwise, write it atomically
+        # so nothing ever sees a partially-written file.
+        filename = os.path.join(path, self.envfile)
+        try:
+            with open(filename, 'rb') as inp:
+                if inp.read() == state:
+                    return
+        except FileNotFoundError:
+            pass
+
+        tmpname = filename + '.tmp'
+        with open(tmpname, 'wb') as out:
+            out.write(state)
+        os.replace(tmpname, filename)
 
     @classmethod
     def load(cls, path):
-        with open(os.path.join(path, cls.envfile)) as inp:
-            state = json.load(inp)
+        with open(os.path.join(path, cls.envfile), 'rb') as inp:
+            state = _load_state(inp.read())
             version, data = state['version'], state['data']
         if version > cls.version:
             raise EnvVersionError('saved version exceeds expected version')
@@ -369,6 +451,8 @@ class Environment:
                 p = target_plat.install_dirs[InstallRoot[i]].to_json()
                 data['install_dirs'][i] = p
 
+        # v18 allows storing the environment as msgpack; no data changes.
+
         # Now that we've upgraded, initialize the Environment object.
         env = cls.__new__(cls)
 
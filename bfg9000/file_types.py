@@ -1,10 +1,18 @@
+import sys as _sys
+
 from . import path as _path, safe_str as _safe_str
 from .iterutils import listify as _listify
 
 
+# Languages and formats are drawn from a small set of names but are stored on
+# every file, so intern them to let all the files share the same strings.
+def _intern(value):
+    return _sys.intern(value) if type(value) is str else value
+
+
 def _clone_traits(exclude=set(), subfiles={}):
     def inner(cls):
-        cls._clone_exclude = cls._clone_exclude | exclude
+        cls._clone_exclude = frozenset(cls._clone_exclude | exclude)
         if subfiles:
             cls._clone_subfiles = cls._clone_subfiles.copy()
             cls._clone_subfiles.update(subfiles)
@@ -51,7 +59,7 @@ class BaseFile:
 
 
 class FileOrDirectory(Node, BaseFile):
-    _clone_exclude = {'path', 'creator', 'post_install'}
+    _clone_exclude = frozenset({'path', 'creator', 'post_install'})
     _clone_subfiles = {}
 
     install_kind = 'data'
@@ -67,20 +75,19 @@ class FileOrDirectory(Node, BaseFile):
 
     def _clone_args(self, pathfn, recursive):
         args = {'path': pathfn(self)}
+        exclude, subfiles = self._clone_exclude, self._clone_subfiles
         for k, v in self.__dict__.items():
-            if k in self._clone_exclude:
+            if k in exclude:
                 continue
-            try:
-                dest = self._clone_subfiles[k]
-                orig = getattr(self, k)
-                if orig is None:
-                    args[dest] = None
-                elif recursive:
-                    args[dest] = pathfn(orig)
-                else:
-                    args[dest] = orig.path
-            except KeyError:
+            dest = subfiles.get(k)
+            if dest is None:
                 args[k] = v
+            elif v is None:
+                args[dest] = None
+            elif recursive:
+                args[dest] = pathfn(v)
+            else:
+                args[dest] = v.path
         return args
 
     def clone(self, pathfn, recursive=False, inner=None):
@@ -130,7 +137,7 @@ class Directory(FileOrDirectory):
 class CodeFile(File):
     def __init__(self, path, lang):
         super().__init__(path)
-        self.lang = lang
+        self.lang = _intern(lang)
 
 
 class SourceFile(CodeFile):
@@ -165,7 +172,7 @@ class HeaderDirectory(Directory):
     def __init__(self, path, files=None, system=False, langs=None):
         super().__init__(path, files)
         self.system = system
-        self.langs = _listify(langs)
+        self.langs = [_intern(i) for i in _listify(langs)]
 
 
 class ModuleDefFile(File):
@@ -189,8 +196,8 @@ class Binary(File):
 
     def __init__(self, path, format, lang=None):
         super().__init__(path)
-        self.format = format
-        self.lang = lang
+        self.format = _intern(format)
+        self.lang = _intern(lang)
 
 
 class ObjectFile(Binary):
@@ -287,7 +294,8 @@ class WholeArchive(StaticLibrary):
         self.library = library
 
     def __getattribute__(self, name):
-        if name in ['library', '_safe_str', '__repr__', '__hash__', '__eq__']:
+        # Python folds this set literal into a frozenset constant.
+        if name in {'library', '_safe_str', '__repr__', '__hash__', '__eq__'}:
             return object.__getattribute__(self, name)
         return getattr(object.__getattribute__(self, 'library'), name)
 
@@ -6,10 +6,17 @@ from itertools import zip_longest
 
 from .exceptions import NonGlobError
 from .iterutils import find_index, list_view
-from .objutils import objectify
+from .objutils import memoize, objectify
 from .path import Path, Root
 
 
+@memoize
+def _translate_glob(pattern):
+    # `find_files` is often called many times with the same patterns (e.g. the
+    # project's default `find_exclude` list), so only compile each one once.
+    return re.compile(fnmatch.translate(pattern))
+
+
 class Glob:
     class Type(Flag):
         file = 1
@@ -49,10 +56,10 @@ class PathGlob(Glob):
             return self == self.yes
 
         def __and__(self, rhs):
-            return type(self)(max(self.value, rhs.value))
+            return self if self.value >= rhs.value else rhs
 
         def __or__(self, rhs):
-            return type(self)(min(self.value, rhs.value))
+            return self if self.value <= rhs.value else rhs
 
     def __init__(self, pattern, type=None, root=Root.srcdir):
         path = Path.ensure(pattern, root)
@@ -89,7 +96,7 @@ class PathGlob(Glob):
 
             starstar = False
             if cls._is_glob(i):
-                globs[-1].append(re.compile(fnmatch.translate(i)).match)
+                globs[-1].append(cls._match_glob(i))
             else:
                 assert i
                 globs[-1].append(cls._match_string(i))
@@ -103,6 +110,15 @@ class PathGlob(Glob):
             lengths[i] += lengths[i + 1]
         return [cls._glob_run(i, j) for i, j in zip(globs, lengths)]
 
+    @classmethod
+    def _match_glob(cls, s):
+        # Globs like `*.cpp` are by far the most common, so match them with a
+        # simple suffix check instead of a regex.
+        if s[0] == '*' and not cls._is_glob(s[1:]):
+            suffix = s[1:]
+            return lambda x: x.endswith(suffix)
+        return _translate_glob(s).match
+
     @staticmethod
     def _match_string(s):
         return lambda x: x == s
@@ -189,7 +205,7 @@ class NameGlob(Glob):
     def __init__(self, pattern, type=None):
         pattern, n = re.subn(self._slash_ex, '', pattern)
         super().__init__(type, n > 0)
-        self.pattern = re.compile(fnmatch.translate(pattern))
+        self.pattern = _translate_glob(pattern)
 
     def match(self, path):
         if self.pattern.match(path.basename()):
@@ -118,13 +118,13 @@ def tween(iterable, delim, prefix=None, suffix=None):
 
 
 def uniques(iterable):
-    def generate_uniques(iterable):
-        seen = set()
-        for item in iterable:
-            if item not in seen:
-                seen.add(item)
-                yield item
-    return list(generate_uniques(iterable))
+    seen = set()
+    result = []
+    for item in iterable:
+        if item not in seen:
+            seen.add(item)
+            result.append(item)
+    return result
 
 
 def recursive_walk(thing, attr, children_attr=None):
@@ -35,6 +35,11 @@ class _LanguageInfo(_VarInfo):
         self._exts = {i: listify(exts.get(i)) for i in allkeys}
         self._auxexts = {i: listify(auxexts.get(i)) for i in allkeys}
 
+        self._extkinds = {}
+        for k, v in chain(self._exts.items(), self._auxexts.items()):
+            for ext in v:
+                self._extkinds.setdefault(ext, k)
+
     exts = _get_prop('_exts', 'file type')
     auxexts = _get_prop('_auxexts', 'file type')
 
@@ -52,10 +57,7 @@ class _LanguageInfo(_VarInfo):
         return self.auxexts(key)[0]
 
     def extkind(self, ext):
-        for k, v in chain(self._exts.items(), self._auxexts.items()):
-            if ext in v:
-                return k
-        return None
+        return self._extkinds.get(ext)
 
 
 class _FormatInfo:
@@ -1,5 +1,6 @@
 import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 from .platforms.basepath import (BasePath, Root, InstallRoot,  # noqa: F401
@@ -69,30 +70,76 @@ def samefile(path1, path2, variables=None):
                             path2.string(variables))
 
 
-def listdir(path, variables=None):
-    dirs, nondirs = [], []
+def _scandir(path, variables=None):
+    dirs, nondirs, links = [], [], set()
     try:
-        names = os.listdir(path.string(variables))
-        for name in names:
-            curpath = path.append(name)
-            if isdir(curpath, variables):
-                dirs.append(curpath.as_directory())
-            else:
-                nondirs.append(curpath)
+        with os.scandir(path.string(variables)) as entries:
+            for entry in entries:
+                curpath = path.append(entry.name)
+                if entry.is_dir():
+                    curpath = curpath.as_directory()
+                    dirs.append(curpath)
+                    if entry.is_symlink():
+                        links.add(curpath)
+                else:
+                    nondirs.append(curpath)
     except OSError:
         pass
+    return dirs, nondirs, links
+
+
+def listdir(path, variables=None):
+    dirs, nondirs, _ = _scandir(path, variables)
     return dirs, nondirs
 
 
-def walk(top, variables=None):
+# Once a walk has visited this many directories, start listing subdirectories
+# in a thread pool ahead of time. For small trees, the overhead of the threads
+# isn't worth it, but for large trees (especially on slow filesystems), this
+# lets us overlap the I/O.
+_parallel_walk_threshold = 32
+
+
+def walk(top, variables=None, cache=None):
     if not exists(top, variables):
         return
-    dirs, nondirs = listdir(top, variables)
-    yield top, dirs, nondirs
-    for d in dirs:
-        if not islink(d, variables):
-            for i in walk(d, variables):
-                yield i
+
+    # If we have a cache, reuse (and remember) the listing for each directory
+    # we visit. Since callers can prune `dirs`, hand out copies of the cached
+    # lists.
+    def listing(base, pending):
+        if cache is None:
+            return pending.result() if pending else _scandir(base, variables)
+        if base not in cache:
+            cache[base] = (pending.result() if pending else
+                           _scandir(base, variables))
+        dirs, nondirs, links = cache[base]
+        return list(dirs), list(nondirs), links
+
+    executor = ThreadPoolExecutor(min(32, (os.cpu_count() or 1) * 4))
+    try:
+        stack = [(top, None)]
+        visited = 0
+        while stack:
+            base, pending = stack.pop()
+            dirs, nondirs, links = listing(base, pending)
+            yield base, dirs, nondirs
+            visited += 1
+
+            # Push the subdirectories in reverse so that we visit them in
+            # order. Note that this happens after yielding so that callers can
+            # prune `dirs` to prevent walking into them.
+            subdirs = [d for d in reversed(dirs) if d not in links]
+            if visited >= _parallel_walk_threshold:
+                stack.extend(
+                    (d, None if cache is not None and d in cache else
+                     executor.submit(_scandir, d, variables))
+                    for d in subdirs
+                )
+            else:
+                stack.extend((d, None) for d in subdirs)
+    finally:
+        executor.shutdown(wait=False)
 
 
 @contextmanager
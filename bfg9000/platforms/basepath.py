@@ -14,7 +14,7 @@ DestDir = Enum('DestDir', ['destdir'])
 
 
 class BasePath(safe_str.safe_string):
-    __slots__ = ['destdir', 'root', 'suffix']
+    __slots__ = ['destdir', 'directory', 'root', 'suffix']
 
     curdir = posixpath.curdir
     pardir = posixpath.pardir
@@ -57,11 +57,16 @@ class BasePath(safe_str.safe_string):
     @classmethod
     def abspath(cls, path, directory=None, absdrive=True):
         drive, path, isdir = cls.__normalize(path, expand_user=True)
-        cwddrive, cwdpath, _ = cls.__normalize(os.getcwd())
-
-        if not drive and absdrive:
-            drive = cwddrive
-        path, _ = cls.__join(cwdpath, path)
+        if posixpath.isabs(path):
+            # Paths from the environment (e.g. `CPATH`) are usually absolute
+            # already, so we only need the working directory's drive, if any.
+            if not drive and absdrive:
+                drive = ntpath.splitdrive(os.getcwd())[0].replace('\\', '/')
+        else:
+            cwddrive, cwdpath, _ = cls.__normalize(os.getcwd())
+            if not drive and absdrive:
+                drive = cwddrive
+            path, _ = cls.__join(cwdpath, path)
         if directory is False and isdir:
             raise ValueError('expected a non-directory path')
         return cls(drive + path, Root.absolute, directory=directory or isdir)
@@ -134,7 +139,15 @@ class BasePath(safe_str.safe_string):
         return type(self)(drive + path, self.root, self.destdir, isdir)
 
     def ext(self):
-        return posixpath.splitext(self.suffix)[1]
+        # This is equivalent to `posixpath.splitext(self.suffix)[1]`, but it's
+        # called for every source file we see, so avoid the overhead of the
+        # generic version.
+        suffix = self.suffix
+        dot = suffix.rfind('.')
+        start = suffix.rfind(self.sep) + 1
+        if dot > start and suffix[start:dot].strip('.'):
+            return suffix[dot:]
+        return ''
 
     def addext(self, ext):
         return type(self)(self.suffix + ext, self.root, self.destdir,
@@ -154,7 +167,10 @@ class BasePath(safe_str.safe_string):
         return self.suffix.split(posixpath.sep) if self.suffix else []
 
     def basename(self):
-        return posixpath.basename(self.suffix)
+        # Like `ext` above, this is called a lot (e.g. for every path `find`
+        # checks), so skip `posixpath.basename`'s extra overhead.
+        suffix = self.suffix
+        return suffix[suffix.rfind(self.sep) + 1:]
 
     def relpath(self, start, prefix='', localize=True):
         if self.root == Root.absolute:
@@ -5,6 +5,8 @@ from .target import TargetPlatform
 
 
 class PosixPath(BasePath):
+    __slots__ = ()
+
     _localized_sep = BasePath.sep
 
     def _localize_path(self, path):
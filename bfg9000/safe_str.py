@@ -4,6 +4,8 @@ from . import iterutils
 
 
 class safe_string:
+    __slots__ = ()
+
     def _safe_format(self, format_spec):
         return self
 
@@ -19,6 +21,8 @@ class safe_string:
 
 
 class safe_string_ops:
+    __slots__ = ()
+
     def __add__(self, rhs):
         return jbos(safe_str(self), safe_str(rhs))
 
@@ -39,6 +43,8 @@ def safe_str(s):
 
 
 class literal_types(safe_string):
+    __slots__ = ('string',)
+
     def __init__(self, string):
         if not isinstance(string, str):
             raise TypeError('expected a string')
@@ -61,14 +67,20 @@ class shell_literal(literal_types):
     you want to use characters with syntactic meaning in your shell (e.g. to
     use I/O redirection."""
 
+    __slots__ = ()
+
 
 class literal(literal_types):
     """A string which has already been escaped for *all* purposes (read: both
     shell and build files), useful if you want to use characters with syntactic
     meaning in your build script."""
 
+    __slots__ = ()
+
 
 class jbos(safe_string):  # Just a Bunch of Strings
+    __slots__ = ('__bits',)
+
     def __init__(self, *args):
         self.__bits = tuple(self.__canonicalize(args))
 
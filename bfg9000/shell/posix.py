@@ -1,3 +1,4 @@
+import functools
 import itertools
 import re
 from shlex import shlex
@@ -14,15 +15,23 @@ __all__ = ['split', 'join', 'listify', 'inner_quote', 'inner_quote_info',
 _bad_chars = re.compile(r'[^\w@%+=:,./-]')
 
 
-def split(s, type=list, escapes=False):
-    if not isinstance(s, str):
-        raise TypeError('expected a string')
+# The same strings (e.g. flags from environment variables) are often split
+# several times, so cache the results. We store them as tuples so that each
+# caller gets its own copy of the result.
+@functools.lru_cache(maxsize=256, typed=True)
+def _split(s, escapes):
     lexer = shlex(s, posix=True)
     lexer.commenters = ''
     if not escapes:
         lexer.escape = ''
     lexer.whitespace_split = True
-    return type(lexer)
+    return tuple(lexer)
+
+
+def split(s, type=list, escapes=False):
+    if not isinstance(s, str):
+        raise TypeError('expected a string')
+    return type(_split(s, escapes))
 
 
 def join(args):
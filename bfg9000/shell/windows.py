@@ -1,6 +1,6 @@
+import functools
 import itertools
 import re
-from collections.abc import MutableSequence
 from enum import Enum
 
 from .list import shell_list
@@ -36,13 +36,13 @@ def _tokenize(s):
             escapes = 0
 
 
-def split(s, type=list):
-    if not isinstance(s, str):
-        raise TypeError('expected a string')
-
-    mutable = isinstance(type, MutableSequence)
+# The same strings (e.g. flags from environment variables) are often split
+# several times, so cache the results. We store them as tuples so that each
+# caller gets its own copy of the result.
+@functools.lru_cache(maxsize=256, typed=True)
+def _split(s):
     state = _State.between
-    args = (type if mutable else list)()
+    args = []
 
     for tok, value in _tokenize(s):
         if state == _State.between:
@@ -65,7 +65,13 @@ def split(s, type=list):
             else:
                 args[-1] += value
 
-    return args if mutable else type(args)
+    return tuple(args)
+
+
+def split(s, type=list):
+    if not isinstance(s, str):
+        raise TypeError('expected a string')
+    return type(_split(s))
 
 
 def join(args):
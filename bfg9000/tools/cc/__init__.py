@@ -8,11 +8,12 @@ from .compiler import CcCompiler, CcPchCompiler
 from .linker import CcExecutableLinker, CcSharedLibraryLinker
 from .rc import CcRcBuilder  # noqa: F401
 from ..ar import ArLinker
-from ..common import Builder, check_which
+from ..common import Builder
 from ..ld import LdLinker
 from ...exceptions import PackageResolutionError
 from ...iterutils import uniques
 from ...languages import known_formats
+from ...objutils import memoize_method
 from ...packages import PackageKind
 from ...path import exists
 from ...platforms import parse_triplet
@@ -53,8 +54,8 @@ class CcBuilder(Builder):
         ldlibs = shell.split(env.getvar(ldinfo.var('libs'), ''))
 
         ar_name = arinfo.var('linker').lower()
-        ar_which = check_which(env.getvar(arinfo.var('linker'), 'ar'),
-                               env.variables, kind='static linker')
+        ar_which = env.check_which(env.getvar(arinfo.var('linker'), 'ar'),
+                                   kind='static linker')
         arflags_name = arinfo.var('flags').lower()
         arflags = shell.split(env.getvar(arinfo.var('flags'), 'cr'))
 
@@ -98,7 +99,8 @@ class CcBuilder(Builder):
         if ld_command:
             self._linkers['raw'] = LdLinker(self, env, ld_command, stdout)
 
-        self.packages = CcPackageResolver(self, env, command, ldflags)
+        self._env = env
+        self._package_args = (command, ldflags)
         self.runner = None
 
     @classmethod
@@ -160,6 +162,14 @@ class CcBuilder(Builder):
     def linker(self, mode):
         return self._linkers[mode]
 
+    # Searching for the package directories requires running the compiler and
+    # linker a few times, so only do so once we actually need to resolve a
+    # package.
+    @property
+    @memoize_method
+    def packages(self):
+        return CcPackageResolver(self, self._env, *self._package_args)
+
 
 class CcPackageResolver:
     def __init__(self, builder, env, command, ldflags):
@@ -52,8 +52,11 @@ class CcLinker(BuildCommand):
     def can_link(self, format, langs):
         if format != self.builder.object_format:
             return False
-        relevant_langs = self.__known_langs.intersection(langs)
-        return self.__allowed_langs[self.lang].issuperset(relevant_langs)
+        # Usually, all the languages are ones we can link directly, so check
+        # that first to avoid building a new set.
+        allowed = self.__allowed_langs[self.lang]
+        return (allowed.issuperset(langs) or
+                allowed.issuperset(self.__known_langs.intersection(langs)))
 
     @property
     def needs_libs(self):
@@ -10,6 +10,7 @@ from ..exceptions import PackageResolutionError
 from ..file_types import *
 from ..iterutils import flatten, iterate, uniques
 from ..languages import known_formats
+from ..objutils import memoize_method
 from ..packages import Package
 from ..path import Path, Root
 from ..versioning import detect_version
@@ -319,11 +320,21 @@ class JvmPackageResolver:
             return []
         return [i.strip() for i in m.group(2).split('\n')]
 
+    # Each package we resolve looks through the same extension directories, so
+    # list each of them once rather than checking for every candidate file.
+    @memoize_method
+    def _dir_contents(self, base):
+        try:
+            return frozenset(os.path.normcase(i) for i in os.listdir(base))
+        except OSError:
+            return frozenset()
+
     def _library(self, name):
         jarname = name + '.jar'
         for base in self.ext_dirs:
             fullpath = os.path.join(base, jarname)
-            if os.path.exists(fullpath):
+            if ( os.path.normcase(jarname) in self._dir_contents(base) and
+                 os.path.exists(fullpath) ):
                 return Library(Path(fullpath, Root.absolute),
                                self.builder.object_format)
 
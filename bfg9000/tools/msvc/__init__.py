@@ -7,22 +7,26 @@ from .compiler import MsvcCompiler, MsvcPchCompiler
 from .linker import (MsvcExecutableLinker, MsvcSharedLibraryLinker,
                      MsvcStaticLinker)
 from .rc import MsvcRcBuilder  # noqa: F401
-from ..common import Builder, check_which
+from ..common import Builder
 from ...iterutils import uniques
 from ...languages import known_formats
+from ...objutils import memoize_method
 from ...path import exists
 from ...versioning import detect_version
 
 
 class MsvcBuilder(Builder):
+    _linker_types = {
+        'executable': MsvcExecutableLinker,
+        'shared_library': MsvcSharedLibraryLinker,
+    }
+
     def __init__(self, env, langinfo, command, found, version_output):
         brand, version = self._parse_brand(env, command, version_output)
         super().__init__(langinfo.name, brand, version)
         self.object_format = env.target_platform.object_format
 
         name = langinfo.var('compiler').lower()
-        ldinfo = known_formats['native']['dynamic']
-        arinfo = known_formats['native']['static']
 
         # Look for the last argument that looks like our compiler and use its
         # directory as the base directory to find the linkers.
@@ -30,14 +34,7 @@ class MsvcBuilder(Builder):
         for i in reversed(command):
             if os.path.basename(i) in ('cl', 'cl.exe'):
                 origin = os.path.dirname(i)
-        link_which = check_which(
-            env.getvar(ldinfo.var('linker'), os.path.join(origin, 'link')),
-            env.variables, kind='{} dynamic linker'.format(self.lang)
-        )
-        lib_which = check_which(
-            env.getvar(arinfo.var('linker'), os.path.join(origin, 'lib')),
-            env.variables, kind='{} static linker'.format(self.lang)
-        )
+                break
 
         cflags_name = langinfo.var('flags').lower()
         cflags = (
@@ -45,34 +42,13 @@ class MsvcBuilder(Builder):
             shell.split(env.getvar(langinfo.var('flags'), ''))
         )
 
-        ld_name = ldinfo.var('linker').lower()
-        ldflags_name = ldinfo.var('flags').lower()
-        ldflags = shell.split(env.getvar(ldinfo.var('flags'), ''))
-        ldlibs_name = ldinfo.var('libs').lower()
-        ldlibs = shell.split(env.getvar(ldinfo.var('libs'), ''))
-
-        ar_name = arinfo.var('linker').lower()
-        arflags_name = arinfo.var('flags').lower()
-        arflags = shell.split(env.getvar(arinfo.var('flags'), ''))
-
         compile_kwargs = {'command': (name, command, found),
                           'flags': (cflags_name, cflags)}
         self.compiler = MsvcCompiler(self, env, **compile_kwargs)
         self.pch_compiler = MsvcPchCompiler(self, env, **compile_kwargs)
 
-        link_kwargs = {'command': (ld_name,) + link_which,
-                       'flags': (ldflags_name, ldflags),
-                       'libs': (ldlibs_name, ldlibs)}
-        self._linkers = {
-            'executable': MsvcExecutableLinker(self, env, name, **link_kwargs),
-            'shared_library': MsvcSharedLibraryLinker(self, env, name,
-                                                      **link_kwargs),
-            'static_library': MsvcStaticLinker(
-                self, env, command=(ar_name,) + lib_which,
-                flags=(arflags_name, arflags)
-            ),
-        }
-        self.packages = MsvcPackageResolver(self, env)
+        self._env = env
+        self._linker_args = (name, origin)
         self.runner = None
 
     @staticmethod
@@ -109,8 +85,47 @@ class MsvcBuilder(Builder):
     def can_dual_link(self):
         return False
 
+    # Finding the linkers requires searching the PATH, so only look up each
+    # one once it's actually needed (e.g. a project that only builds
+    # executables never needs `lib`).
+    @memoize_method
     def linker(self, mode):
-        return self._linkers[mode]
+        env = self._env
+        name, origin = self._linker_args
+
+        if mode == 'static_library':
+            arinfo = known_formats['native']['static']
+            ar_name = arinfo.var('linker').lower()
+            lib_which = env.check_which(
+                env.getvar(arinfo.var('linker'), os.path.join(origin, 'lib')),
+                kind='{} static linker'.format(self.lang)
+            )
+            arflags_name = arinfo.var('flags').lower()
+            arflags = shell.split(env.getvar(arinfo.var('flags'), ''))
+            return MsvcStaticLinker(self, env, command=(ar_name,) + lib_which,
+                                    flags=(arflags_name, arflags))
+
+        linker_type = self._linker_types[mode]
+        ldinfo = known_formats['native']['dynamic']
+        ld_name = ldinfo.var('linker').lower()
+        link_which = env.check_which(
+            env.getvar(ldinfo.var('linker'), os.path.join(origin, 'link')),
+            kind='{} dynamic linker'.format(self.lang)
+        )
+        ldflags_name = ldinfo.var('flags').lower()
+        ldflags = shell.split(env.getvar(ldinfo.var('flags'), ''))
+        ldlibs_name = ldinfo.var('libs').lower()
+        ldlibs = shell.split(env.getvar(ldinfo.var('libs'), ''))
+        return linker_type(self, env, name, command=(ld_name,) + link_which,
+                           flags=(ldflags_name, ldflags),
+                           libs=(ldlibs_name, ldlibs))
+
+    # Searching for the package directories requires running the compiler and
+    # linker, so only do so once we actually need to resolve a package.
+    @property
+    @memoize_method
+    def packages(self):
+        return MsvcPackageResolver(self, self._env)
 
 
 class MsvcPackageResolver:
@@ -1,4 +1,4 @@
-from itertools import chain
+import os.path
 
 from ... import options as opts, safe_str
 from ..common import BuildCommand
@@ -25,8 +25,14 @@ _optimize_flags = {
     opts.OptimizeValue.linktime: '/GL',
 }
 
+# Compiler caches that can be used as a launcher for `cl`, e.g. by setting
+# `CXX='sccache cl'`.
+_compiler_launchers = {'ccache', 'sccache'}
+
 
 class MsvcBaseCompiler(BuildCommand):
+    _always_flags = ['/nologo', '/EHsc']
+
     @property
     def deps_flavor(self):
         return 'msvc'
@@ -44,31 +50,40 @@ class MsvcBaseCompiler(BuildCommand):
         include = self.env.variables.getpaths('INCLUDE')
         return cpath + include
 
+    @property
+    def _debug_flag(self):
+        # Compiler caches can't handle writing debug info to a shared PDB
+        # file, so put it in the object files instead when using one.
+        launcher = os.path.basename(self.command[0]).lower()
+        if os.path.splitext(launcher)[0] in _compiler_launchers:
+            return '/Z7'
+        return '/Zi'
+
     def _call(self, cmd, input, output, deps=None, flags=None):
-        result = list(chain( cmd, self._always_flags, iterate(flags) ))
+        result = list(cmd)
+        result.extend(self._always_flags)
+        result.extend(iterate(flags))
         if deps:
             result.append('/showIncludes')
-        result.extend(['/c', input, '/Fo' + output])
+        result.extend(('/c', input, '/Fo' + output))
         return result
 
-    @property
-    def _always_flags(self):
-        return ['/nologo', '/EHsc']
-
     def flags(self, options, global_options=None, output=None, mode='normal'):
-        syntax = 'cc' if mode == 'pkg-config' else 'msvc'
+        if mode == 'pkg-config':
+            inc_prefix, def_prefix = '-I', '-D'
+        else:
+            inc_prefix, def_prefix = '/I', '/D'
+
         debug = static = False
         flags = []
         for i in options:
             if isinstance(i, opts.include_dir):
-                prefix = '-I' if syntax == 'cc' else '/I'
-                flags.append(prefix + i.directory.path)
+                flags.append(inc_prefix + i.directory.path)
             elif isinstance(i, opts.define):
-                prefix = '-D' if syntax == 'cc' else '/D'
                 if i.value:
-                    flags.append(prefix + i.name + '=' + i.value)
+                    flags.append(def_prefix + i.name + '=' + i.value)
                 else:
-                    flags.append(prefix + i.name)
+                    flags.append(def_prefix + i.name)
             elif isinstance(i, opts.std):
                 flags.append('/std:' + i.value)
             elif isinstance(i, opts.warning):
@@ -76,7 +91,7 @@ class MsvcBaseCompiler(BuildCommand):
                     flags.append(_warning_flags[j])
             elif isinstance(i, opts.debug):
                 debug = True
-                flags.append('/Zi')
+                flags.append(self._debug_flag)
             elif isinstance(i, opts.static):
                 static = True
             elif isinstance(i, opts.optimize):
@@ -1,6 +1,3 @@
-import re
-from itertools import chain
-
 from ... import options as opts, safe_str
 from ..common import BuildCommand, library_macro, SimpleBuildCommand
 from ...arguments.windows import ArgumentParser
@@ -13,13 +10,13 @@ from ...versioning import SpecifierSet
 
 
 class MsvcLinker(BuildCommand):
-    __lib_re = re.compile(r'(.*)\.lib$')
     __known_langs = {'c', 'c++'}
     __allowed_langs = {
         'c'     : {'c'},
         'c++'   : {'c', 'c++'},
     }
 
+    _always_flags = ['/nologo']
     _always_libs = [
         'kernel32', 'user32', 'gdi32', 'winspool', 'comdlg32', 'advapi32',
         'shell32', 'ole32', 'oleaut32', 'uuid', 'odbc32', 'odbccp32',
@@ -27,17 +24,19 @@ class MsvcLinker(BuildCommand):
 
     def _extract_lib_name(self, library):
         lib = library if isinstance(library, str) else library.path.basename()
-        m = self.__lib_re.match(lib)
-        if not m:
+        if not lib.endswith('.lib'):
             raise ValueError("'{}' is not a valid library name"
                              .format(lib))
-        return m.group(1)
+        return lib[:-len('.lib')]
 
     def can_link(self, format, langs):
         if format != self.builder.object_format:
             return False
-        relevant_langs = self.__known_langs.intersection(langs)
-        return self.__allowed_langs[self.lang].issuperset(relevant_langs)
+        # Usually, all the languages are ones we can link directly, so check
+        # that first to avoid building a new set.
+        allowed = self.__allowed_langs[self.lang]
+        return (allowed.issuperset(langs) or
+                allowed.issuperset(self.__known_langs.intersection(langs)))
 
     @property
     def needs_libs(self):
@@ -53,14 +52,13 @@ class MsvcLinker(BuildCommand):
         return lib_path + lib
 
     def _call(self, cmd, input, output, libs=None, flags=None):
-        return list(chain(
-            cmd, self._always_flags, iterate(flags), iterate(input),
-            iterate(libs), ['/OUT:' + output]
-        ))
-
-    @property
-    def _always_flags(self):
-        return ['/nologo']
+        result = list(cmd)
+        result.extend(self._always_flags)
+        result.extend(iterate(flags))
+        result.extend(iterate(input))
+        result.extend(iterate(libs))
+        result.append('/OUT:' + output)
+        return result
 
     def always_libs(self, primary):
         if not primary:
@@ -176,6 +174,8 @@ class MsvcExecutableLinker(MsvcLinker):
 
 
 class MsvcSharedLibraryLinker(MsvcLinker):
+    _always_flags = MsvcLinker._always_flags + ['/DLL']
+
     def __init__(self, builder, env, name, *, command, flags, libs):
         super().__init__(builder, env, name + '_linklib',
                          command=command, flags=flags, libs=libs)
@@ -189,10 +189,6 @@ class MsvcSharedLibraryLinker(MsvcLinker):
         result.append('/IMPLIB:' + output[1])
         return result
 
-    @property
-    def _always_flags(self):
-        return super()._always_flags + ['/DLL']
-
     def compile_options(self, step):
         return opts.option_list(
             opts.define(library_macro(step.name, 'shared_library'))
@@ -212,9 +208,11 @@ class MsvcStaticLinker(SimpleBuildCommand):
         return format == self.builder.object_format
 
     def _call(self, cmd, input, output, flags=None):
-        return list(chain(
-            cmd, iterate(flags), iterate(input), ['/OUT:' + output]
-        ))
+        result = list(cmd)
+        result.extend(iterate(flags))
+        result.extend(iterate(input))
+        result.append('/OUT:' + output)
+        return result
 
     def compile_options(self, step):
         return self.forwarded_compile_options(step)
@@ -1,5 +1,3 @@
-from itertools import chain
-
 from ... import options as opts, safe_str, shell
 from ..common import Builder, SimpleBuildCommand
 from ...arguments.windows import ArgumentParser
@@ -44,6 +42,8 @@ class MsvcRcBuilder(Builder):
 
 
 class MsvcRcCompiler(SimpleBuildCommand):
+    _always_flags = ['/nologo']
+
     @property
     def deps_flavor(self):
         return None
@@ -57,13 +57,11 @@ class MsvcRcCompiler(SimpleBuildCommand):
         return False
 
     def _call(self, cmd, input, output, flags=None):
-        return list(chain(
-            cmd, self._always_flags, iterate(flags), ['/fo', output, input]
-        ))
-
-    @property
-    def _always_flags(self):
-        return ['/nologo']
+        result = list(cmd)
+        result.extend(self._always_flags)
+        result.extend(iterate(flags))
+        result.extend(('/fo', output, input))
+        return result
 
     def default_name(self, input, step):
         return input.path.stripext().suffix
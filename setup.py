@@ -165,6 +165,7 @@ setup(
                 'stdeb'],
         'test': ['coverage', 'flake8 >= 3.7', 'lxml', 'shtab'],
         'msbuild': ['lxml'],
+        'fast': ['msgpack', 'orjson'],
     },
 
     entry_points={
@@ -19,6 +19,36 @@ def mock_open(*args, **kwargs):
     return mo
 
 
+class MockDirEntry:
+    def __init__(self, name, isdir=False, islink=False):
+        self.name = name
+        self._isdir = isdir
+        self._islink = islink
+
+    def is_dir(self, *, follow_symlinks=True):
+        return self._isdir
+
+    def is_symlink(self):
+        return self._islink
+
+
+class _MockScandirIterator(list):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+def mock_scandir(listdir, isdir, islink=lambda name: False):
+    def scandir(path):
+        return _MockScandirIterator(
+            MockDirEntry(i, isdir(i), islink(i)) for i in listdir(path)
+        )
+
+    return scandir
+
+
 def skip_if_platform(platform, hide=False):
     return skip_pred(lambda x: x.platform_name == platform,
                      'not supported for platform "{}"'.format(platform), hide)
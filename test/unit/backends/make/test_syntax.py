@@ -371,6 +371,7 @@ class TestPattern(TestCase):
         self.assertRaises(ValueError, Pattern, '.c')
         self.assertRaises(ValueError, Pattern, '%%.c')
         self.assertRaises(ValueError, Pattern, '%\\\\%.c')
+        self.assertRaises(ValueError, Pattern, '\\%.c')
 
 
 class TestVariable(TestCase):
@@ -598,6 +599,14 @@ class TestMakefile(TestCase):
                           'value')
         self.assertRaises(ValueError, self.makefile.define, 'name', 'value')
 
+    def test_has_variable(self):
+        self.assertFalse(self.makefile.has_variable('my name'))
+        self.makefile.variable('my name', 'value')
+        self.assertTrue(self.makefile.has_variable('my name'))
+        self.assertTrue(self.makefile.has_variable('my_name'))
+        self.assertTrue(self.makefile.has_variable(Variable('my_name')))
+        self.assertFalse(self.makefile.has_variable('other'))
+
     def test_target_variable(self):
         var = self.makefile.target_variable('name', 'value')
         self.assertEqual(var, Variable('name'))
@@ -308,7 +308,7 @@ class TestDirectory(TestGenericFile):
     filename = 'dir'
 
     def test_include(self):
-        def mock_walk(path, variables=None):
+        def mock_walk(path, variables=None, cache=None):
             p = srcpath
             return [
                 (p('dir'), [p('dir/sub')], [p('dir/file.txt')]),
@@ -334,7 +334,7 @@ class TestHeaderDirectory(TestDirectory):
     filename = 'include'
 
     def test_include(self):
-        def mock_walk(path, variables=None):
+        def mock_walk(path, variables=None, cache=None):
             p = srcpath
             return [
                 (p('include'), [p('include/sub')], [p('include/file.hpp')]),
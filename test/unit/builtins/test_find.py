@@ -2,7 +2,7 @@ import os
 from contextlib import contextmanager, ExitStack
 from unittest import mock
 
-from .. import TestCase
+from .. import mock_scandir, TestCase
 from .common import BuiltinTest
 
 from bfg9000.builtins import find, project, regenerate, version  # noqa: F401
@@ -21,30 +21,38 @@ def srcpath(p):
     return Path(p, Root.srcdir)
 
 
+# The contents of each directory in our mock filesystem, keyed by the
+# directory's basename. Anything else is treated as the source root.
+_mock_tree = {
+    'dir': ['file2.txt', 'sub'],
+    'dir2': [],
+    'sub': [],
+}
+_mock_root = ['file.cpp', 'file.cpp~', 'dir', 'dir2']
+
+
+def _mock_listdir(path):
+    return _mock_tree.get(os.path.basename(path), _mock_root)
+
+
+def _mock_exists(path, variables=None):
+    if path.suffix == '':
+        return True
+    return path.basename() in _mock_listdir(path.parent().suffix)
+
+
+def _mock_isdir(name):
+    return not name.startswith('file')
+
+
+_mock_scandir = mock_scandir(_mock_listdir, _mock_isdir)
+
+
 @contextmanager
 def mock_filesystem():
-    def mock_listdir(path):
-        basename = os.path.basename(path)
-        if basename == 'dir':
-            return ['file2.txt', 'sub']
-        elif basename in ['dir2', 'sub']:
-            return []
-        return ['file.cpp', 'file.cpp~', 'dir', 'dir2']
-
-    def mock_exists(path, variables=None):
-        if path.suffix == '':
-            return True
-        paths = mock_listdir(path.parent().suffix)
-        return path.basename() in paths
-
-    def mock_isdir(path, variables=None):
-        return not path.basename().startswith('file')
-
-    with mock.patch('os.listdir', mock_listdir) as a, \
-         mock.patch('bfg9000.path.exists', mock_exists) as b, \
-         mock.patch('bfg9000.path.isdir', mock_isdir) as c, \
-         mock.patch('bfg9000.path.islink', return_value=False) as d:
-        yield a, b, c, d
+    with mock.patch('os.scandir', _mock_scandir) as a, \
+         mock.patch('bfg9000.path.exists', _mock_exists) as b:
+        yield a, b
 
 
 class TestFindResult(TestCase):
@@ -175,6 +183,12 @@ class TestFileFilter(TestCase):
         self.assertEqual(f.match(srcpath('foo.cpp')),
                          find.FindResult.exclude_recursive)
 
+    def test_duplicate_exclude(self):
+        f = find.FileFilter('*.?pp', exclude=['*o*.cpp', '*o*.cpp'])
+        self.assertEqual(f.match(srcpath('foo.hpp')), find.FindResult.include)
+        self.assertEqual(f.match(srcpath('foo.cpp')),
+                         find.FindResult.exclude_recursive)
+
     def test_extra_exclude(self):
         f = find.FileFilter('*.c??', extra='*.?pp', exclude='*.hpp')
         self.assertEqual(f.match(srcpath('foo.cpp')), find.FindResult.include)
@@ -501,6 +515,19 @@ class TestFindFiles(FindTestCase):
                     File(srcpath('dir/file2.txt'))]
         self.assertFound(self.find('**', cache=False), expected)
         self.assertFindDirs(set())
+        self.assertEqual(self.build['find_listings'], {})
+
+    def test_shared_listings(self):
+        expected = [SourceFile(srcpath('file.cpp'), 'c++'),
+                    File(srcpath('dir/file2.txt'))]
+        self.assertFound(self.find('**'), expected)
+        self.assertEqual(set(self.build['find_listings']),
+                         {srcpath('./'), srcpath('dir/'), srcpath('dir2/'),
+                          srcpath('dir/sub/')})
+
+        with mock.patch('os.scandir', side_effect=OSError) as m:
+            self.assertFound(self.find('**'), expected)
+            m.assert_not_called()
 
 
 class TestFindPaths(TestFindFiles):
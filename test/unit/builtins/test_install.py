@@ -97,6 +97,21 @@ class TestInstall(BuiltinTest):
         self.assertEqual(self.build['install'].host, {exe: host})
         self.assertEqual(self.build['install'].target, {exe: target})
 
+    def test_install_shared_dep(self):
+        lib = SharedLibrary(Path('libfoo.so', Root.srcdir), None)
+        exes = [Executable(Path('exe1', Root.srcdir), None),
+                Executable(Path('exe2', Root.srcdir), None)]
+        for i in exes:
+            i.runtime_deps.append(lib)
+
+        with mock.patch('bfg9000.builtins.install.installify',
+                        wraps=install.installify) as m:
+            self.context['install'](*exes)
+        self.assertEqual(m.call_count, 6)
+        self.assertEqual(self.build['install'].explicit, exes)
+        self.assertEqual(list(self.build['install'].host),
+                         [exes[0], lib, exes[1]])
+
     def test_invalid(self):
         phony = Phony('name')
         self.assertRaises(TypeError, self.context['install'], phony)
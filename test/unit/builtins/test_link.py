@@ -751,21 +751,18 @@ class TestLibrary(LinkTest):
         with mock.patch('warnings.warn', lambda s: None):
             result = self.context['library']('library', [src], kind='dual')
 
+        shared = self.output_file('library', mode='shared_library')
+        obj = self.object_file('liblibrary.int/main')
         if self.env.builder('c++').can_dual_link:
             self.assertSameFile(result, file_types.DualUseLibrary(
-                self.output_file('library', mode='shared_library'),
-                self.output_file('library', mode='static_library',
-                                 extra=static_extra)
+                shared, self.output_file('library', mode='static_library',
+                                         extra=static_extra)
             ))
             for i in result.all:
-                self.assertSameFile(i.creator.files[0],
-                                    self.object_file('liblibrary.int/main'))
+                self.assertSameFile(i.creator.files[0], obj)
         else:
-            self.assertSameFile(result, self.output_file(
-                'library', mode='shared_library'
-            ))
-            self.assertSameFile(result.creator.files[0],
-                                self.object_file('liblibrary.int/main'))
+            self.assertSameFile(result, shared)
+            self.assertSameFile(result.creator.files[0], obj)
 
     def test_make_directory(self):
         library = self.context['library']
@@ -947,9 +944,7 @@ class TestMsbuildBackend(BuiltinTest):
         self.patch_builder = mock.patch('bfg9000.tools.c_family._builders',
                                         (MsvcBuilder,))
         self.patch_builder.start()
-
-    def tearDown(self):
-        self.patch_builder.stop()
+        self.addCleanup(self.patch_builder.stop)
 
     def assertSubdict(self, actual, expected):
         subdict = {k: v for k, v in actual.items() if k in expected}
@@ -28,6 +28,11 @@ class TestSplit(TestCase):
         self.assertEqual(posix.split('foo\\ bar'), ['foo\\', 'bar'])
         self.assertEqual(posix.split('foo\\ bar', escapes=True), ['foo bar'])
 
+    def test_copy(self):
+        a = posix.split('foo bar')
+        a.append('baz')
+        self.assertEqual(posix.split('foo bar'), ['foo', 'bar'])
+
     def test_invalid(self):
         self.assertRaises(TypeError, posix.split, 1)
 
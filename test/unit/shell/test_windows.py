@@ -34,6 +34,11 @@ class TestSplit(TestCase):
         self.assertEqual(windows.split('foo bar baz', type=tuple),
                          ('foo', 'bar', 'baz'))
 
+    def test_copy(self):
+        a = windows.split('foo bar')
+        a.append('baz')
+        self.assertEqual(windows.split('foo bar'), ['foo', 'bar'])
+
     def test_invalid(self):
         self.assertRaises(TypeError, windows.split, 1)
 
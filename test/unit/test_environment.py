@@ -1,11 +1,13 @@
 import os
+import tempfile
+from unittest import mock
 
 from . import *
 
 from bfg9000.environment import Environment, EnvVarDict, LibraryMode
 from bfg9000.exceptions import ToolNotFoundError
 from bfg9000.file_types import SourceFile
-from bfg9000.path import Path, Root, InstallRoot
+from bfg9000.path import abspath, Path, Root, InstallRoot
 from bfg9000.tools import rm, lex, scripts  # noqa: F401
 
 this_dir = os.path.abspath(os.path.dirname(__file__))
@@ -138,6 +140,26 @@ class TestEnvVarDict(TestCase):
         self.assertEqual(d.initial, {'foo': 'fooval', 'bar': 'barval'})
         self.assertEqual(d.changes, {})
 
+    def test_getpaths(self):
+        d = EnvVarDict(foo=os.pathsep.join(['/foo', '/bar']))
+        paths = [abspath('/foo'), abspath('/bar')]
+        self.assertEqual(d.getpaths('foo'), paths)
+        self.assertEqual(d.getpaths('foo'), paths)
+        self.assertEqual(d.getpaths('bar'), [])
+        self.assertEqual(d.getpaths('bar', '/baz'), [abspath('/baz')])
+
+        with mock.patch('os.getcwd') as getcwd:
+            d['bar'] = ''
+            self.assertEqual(d.getpaths('bar'), [])
+            self.assertEqual(d.getpaths('quux'), [])
+            getcwd.assert_not_called()
+
+        d['foo'] = '/baz'
+        self.assertEqual(d.getpaths('foo'), [abspath('/baz')])
+
+        d.getpaths('foo').append('/quux')
+        self.assertEqual(d.getpaths('foo'), [abspath('/baz')])
+
 
 class TestEnvironment(TestCase):
     def assertDictsEqual(self, a, b):
@@ -195,6 +217,24 @@ class TestEnvironment(TestCase):
         with self.assertRaises(ToolNotFoundError):
             env.tool('nonexist')
 
+    def test_check_which(self):
+        env = self.make_env()
+        with mock.patch('bfg9000.shell.which',
+                        return_value=['/bin/ar']) as m:
+            self.assertEqual(env.check_which('ar'), (['/bin/ar'], True))
+            self.assertEqual(env.check_which('ar'), (['/bin/ar'], True))
+            self.assertEqual(m.call_count, 1)
+
+            env.variables['PATH'] = '/other/bin'
+            self.assertEqual(env.check_which('ar'), (['/bin/ar'], True))
+            self.assertEqual(m.call_count, 2)
+
+        with mock.patch('bfg9000.shell.which', side_effect=IOError()), \
+             mock.patch('warnings.warn') as m:
+            self.assertEqual(env.check_which('foo'), (['foo'], False))
+            self.assertEqual(env.check_which('foo'), (['foo'], False))
+            self.assertEqual(m.call_count, 1)
+
     def test_run_arguments(self):
         env = self.make_env()
         src = SourceFile(Path('foo.py'), 'python')
@@ -202,6 +242,56 @@ class TestEnvironment(TestCase):
         with self.assertRaises(TypeError):
             env.run_arguments(src, 'nonexist')
 
+    def _check_save_load(self):
+        env = self.make_env()
+        env.finalize({}, (True, False), True, ['--foo'])
+        env.variables['FOO'] = 'bar'
+        with tempfile.TemporaryDirectory() as path:
+            env.save(path)
+            loaded = Environment.load(path)
+
+        self.assertPathEqual(loaded.bfgdir, env.bfgdir)
+        self.assertPathEqual(loaded.srcdir, Path('/srcdir/'))
+        self.assertPathEqual(loaded.builddir, Path('/builddir/'))
+        self.assertEqual(loaded.library_mode, LibraryMode(True, False))
+        self.assertEqual(loaded.compdb, True)
+        self.assertEqual(loaded.extra_args, ['--foo'])
+        self.assertEqual(loaded.variables, env.variables)
+        self.assertEqual(loaded.variables.initial, env.variables.initial)
+
+    def test_save_load(self):
+        self._check_save_load()
+
+    def test_save_unchanged(self):
+        env = self.make_env()
+        env.finalize({}, (True, False), True)
+        with tempfile.TemporaryDirectory() as path:
+            envfile = os.path.join(path, Environment.envfile)
+            env.save(path)
+            ino = os.stat(envfile).st_ino
+
+            env.save(path)
+            self.assertEqual(os.stat(envfile).st_ino, ino)
+
+            env.variables['FOO'] = 'bar'
+            env.save(path)
+            self.assertNotEqual(os.stat(envfile).st_ino, ino)
+            self.assertEqual(os.listdir(path), [Environment.envfile])
+            self.assertEqual(Environment.load(path).variables['FOO'], 'bar')
+
+    def test_save_load_json(self):
+        with mock.patch('bfg9000.environment.msgpack', None):
+            self._check_save_load()
+
+    def test_load_json_with_msgpack(self):
+        env = self.make_env()
+        env.finalize({}, (True, False), True)
+        with tempfile.TemporaryDirectory() as path:
+            with mock.patch('bfg9000.environment.msgpack', None):
+                env.save(path)
+            loaded = Environment.load(path)
+        self.assertPathEqual(loaded.srcdir, Path('/srcdir/'))
+
     def test_upgrade_from_v4(self):
         env = Environment.load(
             os.path.join(test_data_dir, 'environment', 'v4')
@@ -87,6 +87,11 @@ class TestSourceFile(FileTest):
         self.assertClone(SourceFile(Path('a', Root.srcdir), 'c'),
                          SourceFile(Path('a'), 'c'))
 
+    def test_intern_lang(self):
+        lang = ''.join(['c', '++'])
+        self.assertIs(SourceFile(Path('a'), lang).lang,
+                      SourceFile(Path('b'), 'c++').lang)
+
 
 class TestHeaderFile(FileTest):
     def test_clone(self):
@@ -89,6 +89,20 @@ class TestPathGlob(TestCase):
         self.assertMatch(g, src_dir_file_txt, 'never')
         self.assertMatch(g, build_file_txt, 'no')
 
+    def test_star_suffix(self):
+        g = PathGlob('*.txt')
+        self.assertMatch(g, src_file_txt, 'yes')
+        self.assertMatch(g, Path('.txt', Root.srcdir), 'yes')
+        self.assertMatch(g, Path('file.txt.bak', Root.srcdir), 'never')
+        self.assertMatch(g, Path('file.TXT', Root.srcdir), 'never')
+        self.assertMatch(g, src_dir, 'never')
+        self.assertMatch(g, src_dir_file_txt, 'never')
+
+        g = PathGlob('*.t?t')
+        self.assertMatch(g, src_file_txt, 'yes')
+        self.assertMatch(g, Path('file.tat', Root.srcdir), 'yes')
+        self.assertMatch(g, Path('file.tt', Root.srcdir), 'never')
+
     def test_starstar(self):
         g = PathGlob('**')
         self.assertMatch(g, src_file_txt, 'yes')
@@ -192,3 +206,6 @@ class TestNameGlob(TestCase):
         self.assertEqual(g.match(src_dir), True)
         self.assertEqual(g.match(src_dir_file_txt), True)
         self.assertEqual(g.match(build_file_txt), True)
+
+    def test_shared_pattern(self):
+        self.assertIs(NameGlob('*.txt').pattern, NameGlob('*.txt/').pattern)
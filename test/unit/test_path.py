@@ -32,17 +32,17 @@ def mock_filesystem(*, listdir=None, exists=None, isdir=None, islink=None):
     def mock_exists(path, variables=None):
         return True
 
-    def mock_isdir(path, variables=None):
-        return not path.basename().startswith('file')
+    def mock_isdir(name):
+        return not name.startswith('file')
 
-    def mock_islink(path, variables=None):
+    def mock_islink(name):
         return False
 
-    with mock.patch('os.listdir', listdir or mock_listdir) as a, \
-         mock.patch('bfg9000.path.exists', exists or mock_exists) as b, \
-         mock.patch('bfg9000.path.isdir', isdir or mock_isdir) as c, \
-         mock.patch('bfg9000.path.islink', islink or mock_islink) as d:
-        yield a, b, c, d
+    scandir = mock_scandir(listdir or mock_listdir, isdir or mock_isdir,
+                           islink or mock_islink)
+    with mock.patch('os.scandir', scandir) as a, \
+         mock.patch('bfg9000.path.exists', exists or mock_exists) as b:
+        yield a, b
 
 
 class TestPath(PathTestCase):
@@ -435,6 +435,13 @@ class TestPath(PathTestCase):
         p = self.Path('foo.txt', path.Root.srcdir)
         self.assertEqual(p.ext(), '.txt')
 
+        p = self.Path('dir.d/foo.tar.gz', path.Root.srcdir)
+        self.assertEqual(p.ext(), '.gz')
+
+        for i in ('foo', 'dir.d/foo', '.foo', 'dir/..foo', 'foo/'):
+            p = self.Path(i, path.Root.srcdir)
+            self.assertEqual(p.ext(), '', i)
+
     def test_addext(self):
         p = self.Path('foo', path.Root.srcdir)
         self.assertPathEqual(p.addext('.txt'),
@@ -491,6 +498,18 @@ class TestPath(PathTestCase):
         p = self.Path('foo/bar', path.Root.srcdir)
         self.assertEqual(p.basename(), 'bar')
 
+        p = self.Path('foo/bar/', path.Root.srcdir)
+        self.assertEqual(p.basename(), 'bar')
+
+        p = self.Path('bar', path.Root.srcdir)
+        self.assertEqual(p.basename(), 'bar')
+
+        p = self.Path('', path.Root.srcdir)
+        self.assertEqual(p.basename(), '')
+
+        p = self.Path('/', path.Root.srcdir)
+        self.assertEqual(p.basename(), '')
+
     def test_relpath_relative(self):
         p = self.Path('foo/bar', path.Root.srcdir)
         self.assertEqual(p.relpath(p), '.')
@@ -844,10 +863,10 @@ class TestListdir(TestCase):
             self.assertPathListEqual(nondirs, [path.Path('file.cpp')])
 
     def test_not_found(self):
-        def mock_listdir(path):
+        def mock_scandir(path):
             raise OSError()
 
-        with mock.patch('os.listdir', mock_listdir):
+        with mock.patch('os.scandir', mock_scandir):
             dirs, nondirs = path.listdir(path.Path('.'), self.path_vars)
             self.assertEqual(dirs, [])
             self.assertEqual(nondirs, [])
@@ -865,14 +884,54 @@ class TestWalk(TestCase):
                 (Path('dir/sub'), [], []),
             ])
 
+    def test_parallel(self):
+        Path = path.Path
+        with mock_filesystem(), \
+             mock.patch('bfg9000.path._parallel_walk_threshold', 0):
+            self.assertEqual(list(path.walk(Path('.'), self.path_vars)), [
+                (Path('.'), [Path('dir')], [Path('file.cpp')]),
+                (Path('dir'), [Path('dir/sub')], [Path('dir/file2.txt')]),
+                (Path('dir/sub'), [], []),
+            ])
+
+    def test_cache(self):
+        listed = []
+
+        def mock_listdir(path):
+            listed.append(os.path.basename(path))
+            return ['file2.txt', 'sub'] if listed[-1] == 'dir' else []
+
+        Path = path.Path
+        cache = {}
+        with mock_filesystem(listdir=mock_listdir):
+            walker = path.walk(Path('dir'), self.path_vars, cache=cache)
+            base, dirs, files = next(walker)
+            dirs.clear()
+            self.assertEqual(list(walker), [])
+            self.assertEqual(listed, ['dir'])
+
+            self.assertEqual(list(path.walk(Path('dir'), self.path_vars,
+                                            cache=cache)), [
+                (Path('dir'), [Path('dir/sub')], [Path('dir/file2.txt')]),
+                (Path('dir/sub'), [], []),
+            ])
+            self.assertEqual(listed, ['dir', 'sub'])
+
+            self.assertEqual(list(path.walk(Path('dir'), self.path_vars,
+                                            cache=cache)), [
+                (Path('dir'), [Path('dir/sub')], [Path('dir/file2.txt')]),
+                (Path('dir/sub'), [], []),
+            ])
+            self.assertEqual(listed, ['dir', 'sub'])
+
     def test_not_exists(self):
         with mock.patch('bfg9000.path.exists', return_value=False):
             self.assertEqual(list(path.walk(path.Path('.'), self.path_vars)),
                              [])
 
     def test_link(self):
-        def mock_islink(path, variables=None):
-            return path.basename() == 'dir'
+        def mock_islink(name):
+            return name == 'dir'
 
         Path = path.Path
         with mock_filesystem(islink=mock_islink):
@@ -222,6 +222,19 @@ class TestCcBuilder(CrossPlatformTestCase):
                            version)
         self.assertEqual(cc.linker('executable').command, ['g++'])
 
+    def test_lazy_packages(self):
+        with mock.patch('bfg9000.shell.which', mock_which), \
+             mock.patch('bfg9000.shell.execute',
+                        side_effect=mock_execute) as m:
+            cc = CcBuilder(self.env, known_langs['c++'], ['c++'], True,
+                           'version')
+            self.assertFalse(any('-print-search-dirs' in i[0][0]
+                                 for i in m.call_args_list))
+            packages = cc.packages
+            self.assertTrue(any('-print-search-dirs' in i[0][0]
+                                for i in m.call_args_list))
+        self.assertIs(cc.packages, packages)
+
     def test_execution_failure(self):
         def bad_execute(args, **kwargs):
             raise OSError()
@@ -107,6 +107,15 @@ class TestMsvcCompiler(CrossPlatformTestCase):
             opts.option_list(opts.debug()),
         ), ['/MTd'])
 
+        for launcher in ('ccache', 'sccache', '/path/to/sccache.exe'):
+            with mock.patch('bfg9000.shell.which', mock_which):
+                compiler = MsvcBuilder(self.env, known_langs['c++'],
+                                       [launcher, 'cl'], True,
+                                       'version').compiler
+            self.assertEqual(compiler.flags(opts.option_list(
+                opts.debug()
+            )), ['/Z7', '/MDd'])
+
     def test_flags_warning(self):
         self.assertEqual(self.compiler.flags(opts.option_list(
             opts.warning('disable')
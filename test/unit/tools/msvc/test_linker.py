@@ -156,6 +156,13 @@ class TestMsvcLinker(CrossPlatformTestCase):
     def test_lib_flags_empty(self):
         self.assertEqual(self.linker.lib_flags(opts.option_list()), [])
 
+    def test_lib_flags_invalid_lib_name(self):
+        lib = self.Path('/path/to/lib/foo.so')
+        with self.assertRaises(ValueError):
+            self.linker.lib_flags(opts.option_list(
+                opts.lib(SharedLibrary(lib, 'native'))
+            ), mode='pkg-config')
+
     def test_lib_flags_lib(self):
         lib = self.Path('/path/to/lib/foo.lib')
 
@@ -1,3 +1,4 @@
+import os
 from unittest import mock
 
 from ... import *
@@ -43,43 +44,69 @@ class TestMsvcBuilder(CrossPlatformTestCase):
             cc = MsvcBuilder(self.env, known_langs['c++'], ['cl'], True,
                              'version')
 
-        self.assertEqual(cc.flavor, 'msvc')
-        self.assertEqual(cc.compiler.flavor, 'msvc')
-        self.assertEqual(cc.pch_compiler.flavor, 'msvc')
-        self.assertEqual(cc.linker('executable').flavor, 'msvc')
-        self.assertEqual(cc.linker('shared_library').flavor, 'msvc')
-        self.assertEqual(cc.linker('static_library').flavor, 'msvc')
+            self.assertEqual(cc.flavor, 'msvc')
+            self.assertEqual(cc.compiler.flavor, 'msvc')
+            self.assertEqual(cc.pch_compiler.flavor, 'msvc')
+            self.assertEqual(cc.linker('executable').flavor, 'msvc')
+            self.assertEqual(cc.linker('shared_library').flavor, 'msvc')
+            self.assertEqual(cc.linker('static_library').flavor, 'msvc')
 
-        self.assertEqual(cc.compiler.found, True)
-        self.assertEqual(cc.pch_compiler.found, True)
-        self.assertEqual(cc.linker('executable').found, True)
-        self.assertEqual(cc.linker('shared_library').found, True)
+            self.assertEqual(cc.compiler.found, True)
+            self.assertEqual(cc.pch_compiler.found, True)
+            self.assertEqual(cc.linker('executable').found, True)
+            self.assertEqual(cc.linker('shared_library').found, True)
 
-        self.assertEqual(cc.family, 'native')
-        self.assertEqual(cc.auto_link, True)
-        self.assertEqual(cc.can_dual_link, False)
+            self.assertEqual(cc.family, 'native')
+            self.assertEqual(cc.auto_link, True)
+            self.assertEqual(cc.can_dual_link, False)
 
-        self.assertEqual(cc.compiler.num_outputs, 'all')
-        self.assertEqual(cc.pch_compiler.num_outputs, 2)
-        self.assertEqual(cc.linker('executable').num_outputs, 'all')
-        self.assertEqual(cc.linker('shared_library').num_outputs, 2)
+            self.assertEqual(cc.compiler.num_outputs, 'all')
+            self.assertEqual(cc.pch_compiler.num_outputs, 2)
+            self.assertEqual(cc.linker('executable').num_outputs, 'all')
+            self.assertEqual(cc.linker('shared_library').num_outputs, 2)
 
-        self.assertEqual(cc.compiler.deps_flavor, 'msvc')
-        self.assertEqual(cc.pch_compiler.deps_flavor, 'msvc')
+            self.assertEqual(cc.compiler.deps_flavor, 'msvc')
+            self.assertEqual(cc.pch_compiler.deps_flavor, 'msvc')
 
-        self.assertEqual(cc.compiler.needs_libs, False)
-        self.assertEqual(cc.pch_compiler.needs_libs, False)
+            self.assertEqual(cc.compiler.needs_libs, False)
+            self.assertEqual(cc.pch_compiler.needs_libs, False)
 
-        self.assertEqual(cc.compiler.needs_package_options, True)
-        self.assertEqual(cc.pch_compiler.needs_package_options, True)
-        self.assertEqual(cc.linker('executable').needs_package_options, True)
-        self.assertEqual(cc.linker('shared_library').needs_package_options,
-                         True)
+            self.assertEqual(cc.compiler.needs_package_options, True)
+            self.assertEqual(cc.pch_compiler.needs_package_options, True)
+            self.assertEqual(cc.linker('executable').needs_package_options,
+                             True)
+            self.assertEqual(cc.linker('shared_library').needs_package_options,
+                             True)
 
-        self.assertEqual(cc.compiler.accepts_pch, True)
-        self.assertEqual(cc.pch_compiler.accepts_pch, False)
+            self.assertEqual(cc.compiler.accepts_pch, True)
+            self.assertEqual(cc.pch_compiler.accepts_pch, False)
 
-        self.assertRaises(KeyError, lambda: cc.linker('unknown'))
+            self.assertRaises(KeyError, lambda: cc.linker('unknown'))
+
+    def test_linker_origin(self):
+        def which(names, *args, **kwargs):
+            return [names[0]]
+
+        with mock.patch('bfg9000.shell.which', which):
+            cc = MsvcBuilder(self.env, known_langs['c++'],
+                             ['/first/cl', 'wrapper', '/second/cl.exe'], True,
+                             'version')
+
+            self.assertEqual(cc.linker('executable').command,
+                             [os.path.join('/second', 'link')])
+            self.assertEqual(cc.linker('static_library').command,
+                             [os.path.join('/second', 'lib')])
+
+    def test_lazy_linkers(self):
+        with mock.patch('bfg9000.shell.which',
+                        side_effect=mock_which) as m:
+            cc = MsvcBuilder(self.env, known_langs['c++'], ['cl'], True,
+                             'version')
+            m.assert_not_called()
+
+            self.assertIs(cc.linker('static_library'),
+                          cc.linker('static_library'))
+            self.assertEqual(m.call_count, 1)
 
     def test_msvc(self):
         version = ('Microsoft (R) C/C++ Optimizing Compiler Version ' +
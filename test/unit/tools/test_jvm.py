@@ -4,6 +4,7 @@ from unittest import mock
 from .. import *
 
 from bfg9000 import file_types, options as opts
+from bfg9000.exceptions import PackageResolutionError
 from bfg9000.file_types import (Executable, ObjectFile, ObjectFileList,
                                 SourceFile)
 from bfg9000.languages import Languages
@@ -356,6 +357,35 @@ class TestJvmLinker(CrossPlatformTestCase):
             self.linker.flags(opts.option_list(123))
 
 
+class TestJvmPackageResolver(CrossPlatformTestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(clear_variables=True, *args, **kwargs)
+
+    def setUp(self):
+        def mock_execute(*args, **kwargs):
+            return ('    java.class.path = \n' +
+                    '    java.ext.dirs = /ext1\n' +
+                    '        /ext2\n')
+
+        with mock.patch('bfg9000.shell.which', mock_which), \
+             mock.patch('bfg9000.shell.execute', mock_execute):
+            self.packages = JvmBuilder(self.env, known_langs['java'],
+                                       ['javac'], True, 'version').packages
+
+    def test_resolve(self):
+        def mock_listdir(path):
+            return {'/ext1': ['foo.txt'], '/ext2': ['foo.jar']}[path]
+
+        with mock.patch('os.listdir', side_effect=mock_listdir) as m, \
+             mock.patch('os.path.exists', return_value=True), \
+             mock.patch('logging.log'):
+            pkg = self.packages.resolve('foo', None, None, None)
+            self.assertEqual(pkg.name, 'foo')
+            self.assertRaises(PackageResolutionError, self.packages.resolve,
+                              'bar', None, None, None)
+            self.assertEqual(m.call_count, 2)
+
+
 class TestJvmRunnerJava(CrossPlatformTestCase):
     lang = 'java'
     jar_args = ['-jar']